@@ -1,24 +1,56 @@
 from datetime import datetime
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, Any
-import uuid
+from typing import Dict, Any, Optional, Tuple
+import secrets
 
 from .exceptions import InvalidAmountError, InsufficientFundsError
 
+# Quantizer for two-decimal currency amounts
+_CENT = Decimal('0.01')
+
+# Largest cent value a float still represents exactly
+_MAX_EXACT_CENTS = 2 ** 53
+
+# Bound on the relative error of amount * 100 against the decimal amount:
+# half an ulp from parsing the amount plus half from the multiplication,
+# with headroom
+_CENTS_REL_ERROR = 2.0 ** -50
+
+
+def _to_cents(amount: float) -> int:
+    
+    cents = amount * 100
+    rounded = round(cents)
+    
+    # Plain float rounding is exact unless the sub-cent part sits within
+    # float error of a half-cent tie, where half-up and round-half-even
+    # differ; settle those through Decimal. The error grows with magnitude
+    tolerance = 1e-6 + abs(cents) * _CENTS_REL_ERROR
+    if abs(cents) < _MAX_EXACT_CENTS and abs(abs(cents - rounded) - 0.5) > tolerance:
+        return rounded
+    return int(Decimal(str(amount)).quantize(_CENT, ROUND_HALF_UP) * 100)
+
 
 class Account:
     
-    def __init__(self, name: str, initial_balance: float = 0.0) -> None:
+    __slots__ = (
+        '_account_id', '_name', '_balance_cents', '_created_at', '_created_at_iso'
+    )
+    
+    def __init__(
+        self, name: str, initial_balance: float = 0.0, account_id: Optional[str] = None
+    ) -> None:
 
         if initial_balance < 0:
             raise InvalidAmountError(initial_balance)
             
-        self._account_id = str(uuid.uuid4())[:8]  # Short UUID for readability
+        if account_id is None:
+            account_id = secrets.token_hex(4)  # Short random ID for readability
+        self._account_id = account_id
         self._name = name.strip()
-        self._balance = Decimal(str(initial_balance)).quantize(
-            Decimal('0.01'), rounding=ROUND_HALF_UP
-        )
+        self._balance_cents = _to_cents(initial_balance)
         self._created_at = datetime.now()
+        self._created_at_iso = self._created_at.isoformat()  # created_at never changes
         
     @property
     def account_id(self) -> str:
@@ -33,7 +65,12 @@ class Account:
     @property
     def balance(self) -> float:
 
-        return float(self._balance)
+        return self._balance_cents / 100
+    
+    @property
+    def balance_cents(self) -> int:
+
+        return self._balance_cents
     
     @property
     def created_at(self) -> datetime:
@@ -45,44 +82,57 @@ class Account:
         if amount <= 0:
             raise InvalidAmountError(amount)
             
-        decimal_amount = Decimal(str(amount)).quantize(
-            Decimal('0.01'), rounding=ROUND_HALF_UP
-        )
-        self._balance += decimal_amount
+        self._balance_cents += _to_cents(amount)
     
     def withdraw(self, amount: float) -> None:
 
         if amount <= 0:
             raise InvalidAmountError(amount)
             
-        decimal_amount = Decimal(str(amount)).quantize(
-            Decimal('0.01'), rounding=ROUND_HALF_UP
-        )
+        cents = _to_cents(amount)
         
-        if decimal_amount > self._balance:
+        if cents > self._balance_cents:
             raise InsufficientFundsError(
                 self._account_id, 
-                float(decimal_amount), 
-                float(self._balance)
+                cents / 100, 
+                self._balance_cents / 100
             )
             
-        self._balance -= decimal_amount
+        self._balance_cents -= cents
     
     def to_dict(self) -> Dict[str, Any]:
 
         return {
             'account_id': self._account_id,
             'name': self._name,
-            'balance': float(self._balance),
-            'created_at': self._created_at.isoformat()
+            'balance': self._balance_cents / 100,
+            'created_at': self._created_at_iso
         }
     
+    def to_row(self) -> Tuple[str, str, str, str]:
+        """Serialize to a CSV row in the column order of to_dict()."""
+        return (
+            self._account_id,
+            self._name,
+            f"{self._balance_cents / 100:.2f}",
+            self._created_at_iso
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Account':
 
-        account = cls(data['name'], data['balance'])
+        balance = data['balance']
+        if balance < 0:
+            raise InvalidAmountError(balance)
+        
+        # Skip __init__: the ID and timestamp come from the data, so there is
+        # no need to generate new ones only to overwrite them
+        account = cls.__new__(cls)
         account._account_id = data['account_id']
+        account._name = data['name'].strip()
+        account._balance_cents = _to_cents(balance)
         account._created_at = datetime.fromisoformat(data['created_at'])
+        account._created_at_iso = account._created_at.isoformat()
         return account
     
     def __str__(self) -> str:
@@ -93,5 +143,5 @@ class Account:
 
         return (
             f"Account(account_id='{self._account_id}', name='{self._name}', "
-            f"balance={self.balance:.2f}, created_at='{self._created_at.isoformat()}')"
+            f"balance={self.balance:.2f}, created_at='{self._created_at_iso}')"
         ) 
\ No newline at end of file
@@ -1,86 +1,285 @@
+import csv
+import functools
+import io
 import logging
+import operator
+import os
+import queue
+import weakref
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List
-import pandas as pd
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Container,
+    Dict,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from .account import Account
-from .exceptions import AccountNotFoundError
+from .exceptions import AccountNotFoundError, InsufficientFundsError, InvalidAmountError
+
+# Column order of the accounts CSV file
+_CSV_COLUMNS = ('account_id', 'name', 'balance', 'created_at')
+
+# Number of account IDs drawn from one os.urandom call
+_ID_POOL_SIZE = 256
+
+# Files above this size are read with pyarrow when it is installed
+_PYARROW_MIN_BYTES = 256 * 1024
+
+# Read buffer sizes for loading. Larger buffers mean fewer read syscalls on
+# big files at the cost of that much memory held for the duration of a load;
+# pyarrow also parses each block on its own thread, so its blocks are larger
+_READ_BUFFER_SIZE = 1 << 20
+_PYARROW_BLOCK_SIZE = 1 << 22
+
+
+def _configure_logging() -> None:
+    """Configure root logging to emit through a background queue listener.
+    
+    QueueHandler still formats each record on the calling thread; only the
+    stream I/O moves to the listener thread. Like logging.basicConfig, this
+    does nothing if the root logger already has handlers.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, handler)
+    
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.WARNING)
+    listener.start()
+    
+    # Finalizers run newest first at exit, so every Bank's exit hook (see
+    # Bank.__init__) still logs through the listener before it stops
+    weakref.finalize(listener, listener.stop)
+
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+_configure_logging()
+
+
+def _apply_transfers(
+    idx_from: Sequence[int],
+    idx_to: Sequence[int],
+    amounts: Sequence[int],
+    balances: List[int],
+) -> int:
+    """Apply transfers in order to ``balances`` (cents), in place.
+    
+    Returns the position of the first transfer the source cannot cover, or
+    -1 when all of them were applied. Written so Numba can compile it.
+    """
+    for k in range(len(idx_from)):
+        source = idx_from[k]
+        if balances[source] < amounts[k]:
+            return k
+        balances[source] -= amounts[k]
+        balances[idx_to[k]] += amounts[k]
+    return -1
+
+
+@functools.lru_cache(maxsize=None)
+def _transfer_kernel() -> Callable[..., int]:
+    """Return the batch transfer kernel, JIT-compiled when Numba is installed."""
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return _apply_transfers
+    
+    compiled = njit(cache=True)(_apply_transfers)
+    
+    def run(
+        idx_from: Sequence[int],
+        idx_to: Sequence[int],
+        amounts: Sequence[int],
+        balances: List[int],
+    ) -> int:
+        array = np.array(balances, dtype=np.int64)
+        failed = compiled(
+            np.array(idx_from, dtype=np.intp),
+            np.array(idx_to, dtype=np.intp),
+            np.array(amounts, dtype=np.int64),
+            array,
+        )
+        balances[:] = array.tolist()
+        return int(failed)
+    
+    return run
+
+
+def _close_bank(bank_ref: 'weakref.ref[Bank]') -> None:
+    """Close the bank at interpreter exit if it is still alive."""
+    bank = bank_ref()
+    if bank is not None:
+        bank.close()
 
 
 class Bank:
     
-    def __init__(self, csv_file: str = "bank_accounts.csv") -> None:
+    def __init__(
+        self, csv_file: str = "bank_accounts.csv", autosave: bool = True
+    ) -> None:
 
+        # Kept in created_at order: accounts are only ever appended, and
+        # load_from_csv sorts whatever it reads
         self._accounts: Dict[str, Account] = {}
         self._csv_file = Path(csv_file)
         self._logger = logging.getLogger(f"{__name__}.Bank")
         
-        # Load existing accounts if CSV file exists
-        if self._csv_file.exists():
-            self.load_from_csv()
+        # Accounts changed since the last flush, and the number of data rows
+        # currently in the CSV file (including rows superseded by appends)
+        self._dirty: Set[str] = set()
+        self._autosave = autosave
+        self._rows_on_disk = 0
+        
+        # Running balance aggregates for get_bank_summary; the (min, max)
+        # pair is recomputed lazily once a change may have moved an extremum
+        self._total_cents = 0
+        self._extrema: Optional[Tuple[int, int]] = None
+        
+        # Account IDs by holder name, for account_names
+        self._names_index: Dict[str, Set[str]] = {}
+        
+        # Unused account IDs, refilled in batches by _new_account_id
+        self._id_pool: List[str] = []
+        
+        # Load existing accounts; a missing file leaves the bank empty
+        self.load_from_csv()
+        
+        # Write pending changes and compact the journal on shutdown. The
+        # finalizer holds the bank weakly, so it does not keep it alive
+        self._finalizer = weakref.finalize(self, _close_bank, weakref.ref(self))
     
     def create_account(self, name: str, initial_balance: float = 0.0) -> str:
 
         if not name.strip():
             raise ValueError("Account name cannot be empty")
             
-        account = Account(name, initial_balance)
-        account_id = account.account_id
+        account_id = self._new_account_id()
+        account = Account(name, initial_balance, account_id)
         
         self._accounts[account_id] = account
-        self._logger.info(f"Created account {account_id} for {name} with balance ${initial_balance:.2f}")
+        self._index_name(account)
+        self._balance_changed(None, account.balance_cents)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Created account %s for %s with balance $%.2f",
+                account_id,
+                name,
+                initial_balance,
+            )
         
         # Auto-save after creating account
-        self.save_to_csv()
+        self._mark_dirty(account_id)
         
         return account_id
     
+    def create_accounts(self, entries: Iterable[Tuple[str, float]]) -> List[str]:
+        """Create several accounts from (name, initial_balance) pairs at once.
+        
+        All entries are validated before any account is added, and the new
+        accounts are persisted with a single flush.
+        """
+        accounts: Dict[str, Account] = {}
+        for name, initial_balance in entries:
+            if not name.strip():
+                raise ValueError("Account name cannot be empty")
+            account_id = self._new_account_id(accounts)
+            accounts[account_id] = Account(name, initial_balance, account_id)
+        
+        for account in accounts.values():
+            self._accounts[account.account_id] = account
+            self._index_name(account)
+            self._balance_changed(None, account.balance_cents)
+        
+        account_ids = list(accounts)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Created %d accounts", len(account_ids))
+        self._mark_dirty(*account_ids)
+        
+        return account_ids
+    
     def get_account(self, account_id: str) -> Account:
 
-        if account_id not in self._accounts:
+        account = self._accounts.get(account_id)
+        if account is None:
             raise AccountNotFoundError(account_id)
-        return self._accounts[account_id]
+        return account
+    
+    def get_accounts(self, *account_ids: str) -> Tuple[Account, ...]:
+
+        accounts = []
+        for account_id in account_ids:
+            account = self._accounts.get(account_id)
+            if account is None:
+                raise AccountNotFoundError(account_id)
+            accounts.append(account)
+        return tuple(accounts)
     
     def list_accounts(self) -> List[Account]:
         """Get a list of all accounts.
         
         Returns:
-            List of all Account objects
+            List of all Account objects, oldest first
         """
         return list(self._accounts.values())
     
+    def account_names(self) -> KeysView[str]:
+        """Get a set-like view of the names that hold at least one account."""
+        return self._names_index.keys()
+    
     def deposit(self, account_id: str, amount: float) -> None:
 
         account = self.get_account(account_id)
+        old_cents = account.balance_cents
         account.deposit(amount)
+        self._balance_changed(old_cents, account.balance_cents)
         
-        self._logger.info(f"Deposited ${amount:.2f} to account {account_id}")
-        self.save_to_csv()
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Deposited $%.2f to account %s", amount, account_id)
+        self._mark_dirty(account_id)
     
     def withdraw(self, account_id: str, amount: float) -> None:
 
         account = self.get_account(account_id)
+        old_cents = account.balance_cents
         account.withdraw(amount)
+        self._balance_changed(old_cents, account.balance_cents)
         
-        self._logger.info(f"Withdrew ${amount:.2f} from account {account_id}")
-        self.save_to_csv()
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Withdrew $%.2f from account %s", amount, account_id)
+        self._mark_dirty(account_id)
     
-    def transfer(self, from_account_id: str, to_account_id: str, amount: float) -> None:
+    def transfer(
+        self, from_account_id: str, to_account_id: str, amount: float
+    ) -> Tuple[float, float]:
 
         if from_account_id == to_account_id:
             raise ValueError("Cannot transfer to the same account")
             
         # Validate both accounts exist before attempting transfer
-        from_account = self.get_account(from_account_id)
-        to_account = self.get_account(to_account_id)
+        from_account, to_account = self.get_accounts(from_account_id, to_account_id)
         
         # Perform the transfer (atomic operation)
+        old_from_cents = from_account.balance_cents
+        old_to_cents = to_account.balance_cents
         from_account.withdraw(amount)
         try:
             to_account.deposit(amount)
@@ -89,89 +288,401 @@ class Bank:
             from_account.deposit(amount)
             raise e
         
-        self._logger.info(
-            f"Transferred ${amount:.2f} from {from_account_id} to {to_account_id}"
-        )
-        self.save_to_csv()
+        self._balance_changed(old_from_cents, from_account.balance_cents)
+        self._balance_changed(old_to_cents, to_account.balance_cents)
+        
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Transferred $%.2f from %s to %s",
+                amount,
+                from_account_id,
+                to_account_id,
+            )
+        self._mark_dirty(from_account_id, to_account_id)
+        
+        return from_account.balance, to_account.balance
+    
+    def transfer_batch(
+        self,
+        from_account_ids: Sequence[str],
+        to_account_ids: Sequence[str],
+        amounts_cents: Sequence[int],
+    ) -> None:
+        """Apply many transfers, given in integer cents, as one atomic batch.
+        
+        Transfers run in order, so later ones may spend funds received by
+        earlier ones. If any transfer fails no balance is changed.
+        """
+        if not len(from_account_ids) == len(to_account_ids) == len(amounts_cents):
+            raise ValueError("Transfer batch sequences must have the same length")
+        
+        # Map every account in the batch to a slot in a flat balance list
+        accounts: List[Account] = []
+        slots: Dict[str, int] = {}
+        idx_from: List[int] = []
+        idx_to: List[int] = []
+        amounts: List[int] = []
+        for from_account_id, to_account_id, amount in zip(
+            from_account_ids, to_account_ids, amounts_cents
+        ):
+            if from_account_id == to_account_id:
+                raise ValueError("Cannot transfer to the same account")
+            # Whole cents only; raises TypeError for floats
+            amount = operator.index(amount)
+            if amount <= 0:
+                raise InvalidAmountError(amount / 100)
+            for account_id, indexes in (
+                (from_account_id, idx_from),
+                (to_account_id, idx_to),
+            ):
+                slot = slots.get(account_id)
+                if slot is None:
+                    slot = slots[account_id] = len(accounts)
+                    accounts.append(self.get_account(account_id))
+                indexes.append(slot)
+            amounts.append(amount)
+        
+        old_cents = [account.balance_cents for account in accounts]
+        balances = list(old_cents)
+        failed = _transfer_kernel()(idx_from, idx_to, amounts, balances)
+        if failed >= 0:
+            raise InsufficientFundsError(
+                from_account_ids[failed],
+                amounts[failed] / 100,
+                balances[idx_from[failed]] / 100
+            )
+        
+        # Write the results straight into the accounts' cent balances
+        for account, old, new in zip(accounts, old_cents, balances):
+            account._balance_cents = new
+            self._balance_changed(old, new)
+        
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Applied batch of %d transfers", len(idx_from))
+        self._mark_dirty(*slots)
     
     def get_balance(self, account_id: str) -> float:
 
         account = self.get_account(account_id)
         return account.balance
     
+    def get_balances(self, account_ids: Iterable[str]) -> Dict[str, float]:
+        """Get the balances of several accounts, keyed by account ID.
+        
+        Raises AccountNotFoundError for the first ID that does not exist.
+        """
+        accounts = self._accounts
+        balances: Dict[str, float] = {}
+        for account_id in account_ids:
+            account = accounts.get(account_id)
+            if account is None:
+                raise AccountNotFoundError(account_id)
+            balances[account_id] = account.balance
+        return balances
+    
+    def _index_name(self, account: Account) -> None:
+
+        self._names_index.setdefault(account.name, set()).add(account.account_id)
+    
+    def _new_account_id(self, reserved: Container[str] = ()) -> str:
+
+        # Draw entropy for many IDs at once instead of one syscall per account;
+        # 8 hex characters can collide, so skip any ID already in use
+        while True:
+            if not self._id_pool:
+                entropy = os.urandom(4 * _ID_POOL_SIZE).hex()
+                self._id_pool = [entropy[i:i + 8] for i in range(0, len(entropy), 8)]
+            account_id = self._id_pool.pop()
+            if account_id not in self._accounts and account_id not in reserved:
+                return account_id
+    
+    def _balance_changed(self, old_cents: Optional[int], new_cents: int) -> None:
+
+        if old_cents is not None:
+            self._total_cents -= old_cents
+        self._total_cents += new_cents
+        
+        if self._extrema is None:
+            return
+        low, high = self._extrema
+        if (old_cents == low and new_cents > low) or (
+            old_cents == high and new_cents < high
+        ):
+            # The extremum may now belong to another account
+            self._extrema = None
+        else:
+            self._extrema = (min(low, new_cents), max(high, new_cents))
+    
+    def _mark_dirty(self, *account_ids: str) -> None:
+
+        self._dirty.update(account_ids)
+        if self._autosave:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write accounts changed since the last flush to the CSV file.
+        
+        Changed rows are appended to the file; the loader keeps the last row
+        seen for each account. Once the file holds more than twice as many
+        rows as there are accounts, it is compacted with a full rewrite.
+        """
+        if not self._dirty:
+            return
+        
+        pending = len(self._dirty)
+        if (
+            self._rows_on_disk == 0
+            or self._rows_on_disk + pending > 2 * len(self._accounts)
+        ):
+            self.save_to_csv()
+            return
+        
+        appended = False
+        try:
+            with open(self._csv_file, 'rb+') as f:
+                # Only append onto a complete file: rows appended to a file
+                # without a header make it unloadable, and a row appended to
+                # a last line torn by a crash would be merged into it
+                if self._ends_with_newline(f):
+                    with io.TextIOWrapper(f, encoding='utf-8', newline='') as text:
+                        csv.writer(text).writerows(
+                            self._accounts[account_id].to_row()
+                            for account_id in self._dirty
+                        )
+                    appended = True
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self._logger.error("Failed to append accounts to CSV: %s", e)
+            raise
+        
+        if not appended:
+            # The file is missing, empty or torn: rewrite it from memory
+            self.save_to_csv()
+            return
+        
+        self._rows_on_disk += pending
+        self._dirty.clear()
+    
+    @staticmethod
+    def _ends_with_newline(f: BinaryIO) -> bool:
+
+        if f.seek(0, os.SEEK_END) == 0:
+            return False
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b'\n'
+    
+    def close(self) -> None:
+        """Write pending changes and compact the CSV file.
+        
+        Called automatically at interpreter exit for banks that are still
+        alive and have not been closed; a bank that is garbage collected
+        first is not closed, so call flush() or close() before dropping one
+        created with autosave=False. Superseded journal rows are only
+        dropped while the file still exists, so closing a bank whose file
+        was removed does not recreate it.
+        """
+        self._finalizer.detach()
+        if self._dirty or (
+            self._rows_on_disk > len(self._accounts) and self._csv_file.exists()
+        ):
+            self.save_to_csv()
+    
     def save_to_csv(self) -> None:
 
         try:
-            # Convert accounts to list of dictionaries
-            accounts_data = [account.to_dict() for account in self._accounts.values()]
+            # Build the whole file in memory, then write it with a single call;
+            # a serialization error also leaves the existing file intact
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(_CSV_COLUMNS)
+            writer.writerows(account.to_row() for account in self._accounts.values())
             
-            if accounts_data:
-                # Use pandas for robust CSV handling
-                df = pd.DataFrame(accounts_data)
-                df.to_csv(self._csv_file, index=False, float_format='%.2f')
-                self._logger.info(f"Saved {len(accounts_data)} accounts to {self._csv_file}")
-            else:
-                # Create empty CSV with headers
-                pd.DataFrame(columns=['account_id', 'name', 'balance', 'created_at']).to_csv(
-                    self._csv_file, index=False
+            # Write to a temporary file and swap it in, so a crash mid-write
+            # never leaves a truncated CSV behind
+            tmp_file = self._csv_file.with_name(self._csv_file.name + '.tmp')
+            try:
+                with open(tmp_file, 'w', encoding='utf-8', newline='') as f:
+                    f.write(buffer.getvalue())
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self._csv_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
+            
+            if self._accounts:
+                self._logger.info(
+                    "Saved %d accounts to %s", len(self._accounts), self._csv_file
                 )
-                self._logger.info(f"Created empty CSV file: {self._csv_file}")
+            else:
+                self._logger.info("Created empty CSV file: %s", self._csv_file)
                 
         except Exception as e:
-            self._logger.error(f"Failed to save accounts to CSV: {e}")
+            self._logger.error("Failed to save accounts to CSV: %s", e)
             raise
+        
+        self._rows_on_disk = len(self._accounts)
+        self._dirty.clear()
+    
+    def reload(self) -> None:
+        """Replace the in-memory accounts with the contents of the CSV file.
+        
+        Changes that have not been flushed yet are discarded.
+        """
+        self._accounts = {}
+        self._names_index = {}
+        self._dirty.clear()
+        self._rows_on_disk = 0
+        self._total_cents = 0
+        self._extrema = None
+        self.load_from_csv()
     
     def load_from_csv(self) -> None:
 
         try:
-            if not self._csv_file.exists():
-                self._logger.info(f"CSV file {self._csv_file} does not exist")
+            # A single stat both checks existence and sizes the file
+            try:
+                size = self._csv_file.stat().st_size
+            except FileNotFoundError:
+                self._logger.info("CSV file %s does not exist", self._csv_file)
                 return
             
             # Check if file is empty or just contains whitespace
-            if self._csv_file.stat().st_size == 0:
+            if size == 0:
                 self._logger.info("CSV file is empty")
                 return
-                
-            # Use pandas for robust CSV reading
-            try:
-                df = pd.read_csv(self._csv_file)
-            except pd.errors.EmptyDataError:
-                self._logger.info("CSV file contains no data")
-                return
             
-            if df.empty:
-                self._logger.info("CSV file is empty")
-                return
-                
-            # Validate required columns
-            required_columns = {'account_id', 'name', 'balance', 'created_at'}
-            if not required_columns.issubset(df.columns):
-                missing_cols = required_columns - set(df.columns)
-                raise ValueError(f"CSV missing required columns: {missing_cols}")
+            # Large files go through pyarrow's multithreaded typed reader when
+            # it is installed and the file parses cleanly
+            rows = None
+            if size > _PYARROW_MIN_BYTES:
+                rows = self._read_rows_with_pyarrow()
+            if rows is None:
+                rows = self._read_rows_with_csv()
             
-            # Load accounts
+            # Load accounts; a later row for the same account supersedes
+            # earlier ones (see flush)
+            rows_read = 0
             loaded_count = 0
-            for _, row in df.iterrows():
+            for account_id, name, balance, created_at in rows:
+                rows_read += 1
                 try:
-                    account_data = row.to_dict()
-                    account = Account.from_dict(account_data)
+                    account = Account.from_dict({
+                        'account_id': account_id,
+                        'name': name,
+                        'balance': float(balance),
+                        'created_at': created_at,
+                    })
                     self._accounts[account.account_id] = account
                     loaded_count += 1
                 except Exception as e:
-                    self._logger.warning(f"Failed to load account from row {row.name}: {e}")
+                    self._logger.warning(
+                        "Failed to load account from row %d: %s", rows_read, e
+                    )
                     continue
             
-            self._logger.info(f"Loaded {loaded_count} accounts from {self._csv_file}")
+            # Restore the created_at ordering; already-sorted input costs O(N)
+            try:
+                self._accounts = dict(
+                    sorted(self._accounts.items(), key=lambda item: item[1].created_at)
+                )
+            except TypeError:
+                # Naive and timezone-aware timestamps cannot be compared
+                self._logger.warning("Mixed created_at timezones; keeping file order")
+            self._names_index = {}
+            for account in self._accounts.values():
+                self._index_name(account)
+            self._rows_on_disk = rows_read
+            self._total_cents = sum(
+                account.balance_cents for account in self._accounts.values()
+            )
+            self._extrema = None
+            self._logger.info(
+                "Loaded %d accounts from %s", loaded_count, self._csv_file
+            )
             
         except Exception as e:
-            self._logger.error(f"Failed to load accounts from CSV: {e}")
+            self._logger.error("Failed to load accounts from CSV: %s", e)
             raise
     
+    def _read_rows_with_csv(self) -> Iterator[Tuple[Any, ...]]:
+
+        # Files are written as UTF-8; utf-8-sig also accepts the BOM that
+        # spreadsheet programs put in front of exported CSV files
+        with open(
+            self._csv_file,
+            encoding='utf-8-sig',
+            newline='',
+            buffering=_READ_BUFFER_SIZE,
+        ) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            
+            # A file holding only blank lines has no usable header
+            if not header or not any(name.strip() for name in header):
+                self._logger.info("CSV file contains no data")
+                return
+            
+            # Validate the header before touching any data rows; files
+            # written by save_to_csv match the canonical layout exactly
+            if tuple(header) == _CSV_COLUMNS:
+                id_col, name_col, balance_col, created_col = range(len(_CSV_COLUMNS))
+            else:
+                missing_cols = set(_CSV_COLUMNS) - set(header)
+                if missing_cols:
+                    raise ValueError(f"CSV missing required columns: {missing_cols}")
+                
+                # Resolve column positions once rather than per row
+                id_col, name_col, balance_col, created_col = (
+                    header.index(column) for column in _CSV_COLUMNS
+                )
+            
+            for row in reader:
+                if not row:
+                    continue
+                # Short rows are passed through and rejected by the caller
+                yield tuple(
+                    row[col] if col < len(row) else None
+                    for col in (id_col, name_col, balance_col, created_col)
+                )
+    
+    def _read_rows_with_pyarrow(self) -> Optional[Iterator[Tuple[Any, ...]]]:
+
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            return None
+        
+        try:
+            table = pa_csv.read_csv(
+                self._csv_file,
+                read_options=pa_csv.ReadOptions(block_size=_PYARROW_BLOCK_SIZE),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={
+                        'account_id': pa.string(),
+                        'name': pa.string(),
+                        'balance': pa.float64(),
+                        'created_at': pa.string(),
+                    },
+                    include_columns=list(_CSV_COLUMNS),
+                ),
+            )
+        except pa.ArrowException as e:
+            # Missing columns or corrupted values: let the csv module path
+            # report or skip them row by row
+            self._logger.info(
+                "pyarrow could not read %s (%s); using csv module", self._csv_file, e
+            )
+            return None
+        
+        columns = table.to_pydict()
+        return zip(*(columns[column] for column in _CSV_COLUMNS))
+    
     def get_bank_summary(self) -> Dict[str, any]:
 
-        accounts = list(self._accounts.values())
-        total_accounts = len(accounts)
+        total_accounts = len(self._accounts)
         
         if total_accounts == 0:
             return {
@@ -182,15 +693,19 @@ class Bank:
                 'max_balance': 0.0
             }
         
-        balances = [account.balance for account in accounts]
-        total_balance = sum(balances)
+        if self._extrema is None:
+            balances = [account.balance_cents for account in self._accounts.values()]
+            self._extrema = (min(balances), max(balances))
+        
+        total_balance = self._total_cents / 100
+        min_cents, max_cents = self._extrema
         
         return {
             'total_accounts': total_accounts,
             'total_balance': total_balance,
             'average_balance': total_balance / total_accounts,
-            'min_balance': min(balances),
-            'max_balance': max(balances)
+            'min_balance': min_cents / 100,
+            'max_balance': max_cents / 100
         }
     
     def __len__(self) -> int:
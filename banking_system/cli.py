@@ -1,4 +1,5 @@
 import sys
+from typing import Callable, Dict, Optional
 
 from .bank import Bank
 from .exceptions import (
@@ -13,6 +14,16 @@ class BankingCLI:
 
         self.bank = Bank(csv_file)
         self.running = True
+        self._menu: Dict[str, Callable[[], None]] = {
+            "1": self.create_account,
+            "2": self.deposit_money,
+            "3": self.withdraw_money,
+            "4": self.transfer_money,
+            "5": self.check_balance,
+            "6": self.list_accounts,
+            "7": self.show_bank_summary,
+            "8": self.exit,
+        }
     
     def display_menu(self) -> None:
 
@@ -29,44 +40,51 @@ class BankingCLI:
         print("8. Exit")
         print("="*50)
     
-    def get_user_input(self, prompt: str, input_type: type = str) -> any:
+    def _read_str(self, prompt: str) -> Optional[str]:
 
         while True:
             try:
                 user_input = input(f"{prompt}: ").strip()
-                if input_type == str:
-                    if not user_input:
-                        print("Input cannot be empty. Please try again.")
-                        continue
-                    return user_input
-                elif input_type == float:
-                    value = float(user_input)
-                    if value < 0:
-                        print("Amount cannot be negative. Please try again.")
-                        continue
-                    return value
-                elif input_type == int:
-                    return int(user_input)
-                else:
-                    return input_type(user_input)
+            except KeyboardInterrupt:
+                print("\nOperation cancelled.")
+                return None
+            if user_input:
+                return user_input
+            print("Input cannot be empty. Please try again.")
+    
+    def _read_amount(self, prompt: str) -> Optional[float]:
+
+        while True:
+            try:
+                value = float(input(f"{prompt}: ").strip())
             except ValueError:
-                print(f"Invalid input. Please enter a valid {input_type.__name__}.")
+                print("Invalid input. Please enter a valid float.")
+                continue
             except KeyboardInterrupt:
                 print("\nOperation cancelled.")
                 return None
+            if value >= 0:
+                return value
+            print("Amount cannot be negative. Please try again.")
+    
+    def _read_choice(self, prompt: str) -> Optional[str]:
+
+        # Anything that is not a menu key, blank included, is rejected by run()
+        try:
+            return input(f"{prompt}: ").strip()
+        except KeyboardInterrupt:
+            print("\nOperation cancelled.")
+            return None
     
     def create_account(self) -> None:
 
         print("\n--- Create New Account ---")
         
-        name = self.get_user_input("Enter account holder name")
+        name = self._read_str("Enter account holder name")
         if name is None:
             return
             
-        initial_balance = self.get_user_input(
-            "Enter initial balance (default: 0.00)", 
-            float
-        )
+        initial_balance = self._read_amount("Enter initial balance (default: 0.00)")
         if initial_balance is None:
             return
         
@@ -83,11 +101,11 @@ class BankingCLI:
 
         print("\n--- Deposit Money ---")
         
-        account_id = self.get_user_input("Enter account ID")
+        account_id = self._read_str("Enter account ID")
         if account_id is None:
             return
             
-        amount = self.get_user_input("Enter deposit amount", float)
+        amount = self._read_amount("Enter deposit amount")
         if amount is None:
             return
         
@@ -104,7 +122,7 @@ class BankingCLI:
 
         print("\n--- Withdraw Money ---")
         
-        account_id = self.get_user_input("Enter account ID")
+        account_id = self._read_str("Enter account ID")
         if account_id is None:
             return
             
@@ -115,7 +133,7 @@ class BankingCLI:
             print(f"\n❌ {e}")
             return
             
-        amount = self.get_user_input("Enter withdrawal amount", float)
+        amount = self._read_amount("Enter withdrawal amount")
         if amount is None:
             return
         
@@ -132,31 +150,30 @@ class BankingCLI:
 
         print("\n--- Transfer Money ---")
         
-        from_account = self.get_user_input("Enter source account ID")
+        from_account = self._read_str("Enter source account ID")
         if from_account is None:
             return
             
-        to_account = self.get_user_input("Enter destination account ID")
+        to_account = self._read_str("Enter destination account ID")
         if to_account is None:
             return
         
         try:
-            from_balance = self.bank.get_balance(from_account)
-            to_balance = self.bank.get_balance(to_account)
-            print(f"Source Account Balance: ${from_balance:.2f}")
-            print(f"Destination Account Balance: ${to_balance:.2f}")
+            source, destination = self.bank.get_accounts(from_account, to_account)
+            print(f"Source Account Balance: ${source.balance:.2f}")
+            print(f"Destination Account Balance: ${destination.balance:.2f}")
         except AccountNotFoundError as e:
             print(f"\n❌ {e}")
             return
             
-        amount = self.get_user_input("Enter transfer amount", float)
+        amount = self._read_amount("Enter transfer amount")
         if amount is None:
             return
         
         try:
-            self.bank.transfer(from_account, to_account, amount)
-            new_from_balance = self.bank.get_balance(from_account)
-            new_to_balance = self.bank.get_balance(to_account)
+            new_from_balance, new_to_balance = self.bank.transfer(
+                from_account, to_account, amount
+            )
             
             print(f"\n✅ Transfer successful!")
             print(f"Transferred: ${amount:.2f}")
@@ -169,7 +186,7 @@ class BankingCLI:
 
         print("\n--- Check Balance ---")
         
-        account_id = self.get_user_input("Enter account ID")
+        account_id = self._read_str("Enter account ID")
         if account_id is None:
             return
         
@@ -197,7 +214,8 @@ class BankingCLI:
         print(f"{'ID':<10} {'Name':<20} {'Balance':<15} {'Created':<20}")
         print("-" * 70)
         
-        for account in sorted(accounts, key=lambda x: x.created_at):
+        # Bank.list_accounts() is already ordered by creation time
+        for account in accounts:
             print(f"{account.account_id:<10} {account.name:<20} "
                   f"${account.balance:<14.2f} "
                   f"{account.created_at.strftime('%Y-%m-%d %H:%M'):<20}")
@@ -217,6 +235,13 @@ class BankingCLI:
             print(f"Minimum Account Balance: ${summary['min_balance']:.2f}")
             print(f"Maximum Account Balance: ${summary['max_balance']:.2f}")
     
+    def exit(self) -> None:
+
+        self.bank.close()
+        print("\nThank you for using the Simple Banking System!")
+        print("All data has been saved automatically.")
+        self.running = False
+    
     def run(self) -> None:
 
         print("Welcome to the Simple Banking System!")
@@ -225,34 +250,20 @@ class BankingCLI:
         while self.running:
             try:
                 self.display_menu()
-                choice = self.get_user_input("Enter your choice (1-8)", str)
+                choice = self._read_choice("Enter your choice (1-8)")
                 
                 if choice is None:
                     continue
                 
-                if choice == "1":
-                    self.create_account()
-                elif choice == "2":
-                    self.deposit_money()
-                elif choice == "3":
-                    self.withdraw_money()
-                elif choice == "4":
-                    self.transfer_money()
-                elif choice == "5":
-                    self.check_balance()
-                elif choice == "6":
-                    self.list_accounts()
-                elif choice == "7":
-                    self.show_bank_summary()
-                elif choice == "8":
-                    print("\nThank you for using the Simple Banking System!")
-                    print("All data has been saved automatically.")
-                    self.running = False
-                else:
+                action = self._menu.get(choice)
+                if action is None:
                     print("\n❌ Invalid choice. Please select 1-8.")
+                else:
+                    action()
                     
             except KeyboardInterrupt:
                 print("\n\nExiting Banking System...")
+                self.bank.close()
                 self.running = False
             except Exception as e:
                 print(f"\n❌ Unexpected error: {e}")
@@ -15,6 +15,11 @@ class TestAccount:
         assert len(account.account_id) == 8  # Short UUID
         assert isinstance(account.created_at, datetime)
     
+    def test_account_creation_with_explicit_id(self):
+        account = Account("John Doe", 100.0, "abcd1234")
+        
+        assert account.account_id == "abcd1234"
+    
     def test_account_creation_with_default_balance(self):
         account = Account("Jane Smith")
         
@@ -121,6 +126,16 @@ class TestAccount:
         assert account_dict['account_id'] == account.account_id
         assert isinstance(account_dict['created_at'], str)  # ISO format
     
+    def test_to_row_conversion(self):
+        account = Account("Mary Rodriguez", 75.5)
+        
+        assert account.to_row() == (
+            account.account_id,
+            "Mary Rodriguez",
+            "75.50",
+            account.created_at.isoformat()
+        )
+    
     def test_from_dict_creation(self):
         account_data = {
             'account_id': 'test123',
@@ -136,6 +151,17 @@ class TestAccount:
         assert account.balance == 200.0
         assert account.created_at == datetime.fromisoformat('2024-01-15T10:30:00')
     
+    def test_from_dict_negative_balance_raises_error(self):
+        account_data = {
+            'account_id': 'test123',
+            'name': 'Nathan Taylor',
+            'balance': -5.0,
+            'created_at': '2024-01-15T10:30:00'
+        }
+        
+        with pytest.raises(InvalidAmountError):
+            Account.from_dict(account_data)
+    
     def test_account_string_representation(self):
         account = Account("Olivia Anderson", 150.0)
         
@@ -162,6 +188,13 @@ class TestAccount:
         assert account.name == original_name
         assert account.created_at == original_created_at
     
+    def test_account_uses_slots(self):
+        account = Account("Uma Patel", 10.0)
+        
+        assert not hasattr(account, '__dict__')
+        with pytest.raises(AttributeError):
+            account.nickname = "Uma"
+    
     def test_decimal_rounding_precision(self):
         account = Account("Quinn Johnson")
         
@@ -172,6 +205,19 @@ class TestAccount:
         # Total should be 16.00 (10.33 + 5.67)
         assert account.balance == 16.0
     
+    def test_half_cent_amounts_round_half_up(self):
+        account = Account("Tina Brooks")
+        
+        account.deposit(0.125)   # Exact half cent, rounds up to 0.13
+        account.deposit(10.335)  # Stored as 10.33499..., still rounds up to 10.34
+        
+        assert account.balance == 10.47
+        
+        # Float error in amount * 100 grows with magnitude
+        large = Account("Tina Brooks")
+        large.deposit(597504338.175)
+        assert large.balance_cents == 59750433818
+    
     def test_large_amounts(self):
         account = Account("Rachel Davis", 1000000.0)  # One million
         
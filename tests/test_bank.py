@@ -1,10 +1,17 @@
 import pytest
+import csv
+import gc
+import itertools
+import logging
 import os
+import subprocess
+import sys
 import tempfile
-import pandas as pd
+import weakref
 from pathlib import Path
+from unittest.mock import patch
 
-from banking_system.bank import Bank
+from banking_system.bank import Bank, _apply_transfers, _transfer_kernel
 from banking_system.exceptions import (
     AccountNotFoundError,
     InsufficientFundsError,
@@ -24,10 +31,21 @@ class TestBank:
         if os.path.exists(temp_path):
             os.unlink(temp_path)
     
+    @pytest.fixture(scope='module')
+    def bank_factory(self, tmp_path_factory):
+        """Create banks backed by fresh CSV files in one shared directory"""
+        directory = tmp_path_factory.mktemp("banks")
+        counter = itertools.count()
+        
+        def make_bank(**kwargs):
+            return Bank(directory / f"bank_{next(counter)}.csv", **kwargs)
+        
+        return make_bank
+    
     @pytest.fixture
-    def bank(self, temp_csv_file):
-        """Create a bank instance with temporary CSV file"""
-        return Bank(temp_csv_file)
+    def bank(self, bank_factory):
+        """Create a bank instance with its own CSV file"""
+        return bank_factory()
     
     def test_bank_initialization_empty(self, temp_csv_file):
         bank = Bank(temp_csv_file)
@@ -42,6 +60,18 @@ class TestBank:
         assert account_id in bank
         assert bank.get_balance(account_id) == 100.0
     
+    def test_create_account_skips_ids_in_use(self, bank):
+        existing_id = bank.create_account("John Doe", 100.0)
+        
+        # IDs are popped from the end of the pool
+        bank._id_pool = ['0000beef', '0000cafe', existing_id]
+        assert bank.create_account("Jane Smith") == '0000cafe'
+        
+        bank._id_pool = ['0000f00d', '0000beef', '0000beef']
+        account_ids = bank.create_accounts([("Alice", 1.0), ("Bob", 2.0)])
+        assert account_ids == ['0000beef', '0000f00d']
+        assert len(bank) == 4
+    
     def test_create_account_default_balance(self, bank):
         account_id = bank.create_account("Jane Smith")
         
@@ -53,6 +83,21 @@ class TestBank:
         
         assert "Account name cannot be empty" in str(exc_info.value)
     
+    def test_create_accounts(self, temp_csv_file):
+        bank = Bank(temp_csv_file)
+        account_ids = bank.create_accounts([("Alice", 10.0), ("Bob", 20.0)])
+        
+        assert len(account_ids) == 2
+        assert bank.get_account(account_ids[1]).name == "Bob"
+        assert bank.get_bank_summary()['total_balance'] == 30.0
+        assert len(Bank(temp_csv_file)) == 2
+    
+    def test_create_accounts_validates_all_entries_first(self, bank):
+        with pytest.raises(ValueError):
+            bank.create_accounts([("Alice", 10.0), ("   ", 20.0)])
+        
+        assert len(bank) == 0
+    
     def test_get_account_existing(self, bank):
         account_id = bank.create_account("Bob Wilson", 50.0)
         account = bank.get_account(account_id)
@@ -66,6 +111,29 @@ class TestBank:
         
         assert exc_info.value.account_id == "invalid123"
     
+    def test_get_accounts(self, bank):
+        id1 = bank.create_account("Bob Wilson", 50.0)
+        id2 = bank.create_account("Carol Brown", 75.0)
+        
+        account1, account2 = bank.get_accounts(id1, id2)
+        assert account1.name == "Bob Wilson"
+        assert account2.balance == 75.0
+        
+        with pytest.raises(AccountNotFoundError) as exc_info:
+            bank.get_accounts(id1, "invalid123")
+        assert exc_info.value.account_id == "invalid123"
+    
+    def test_get_balances(self, bank):
+        id1 = bank.create_account("Bob Wilson", 50.0)
+        id2 = bank.create_account("Carol Brown", 75.0)
+        
+        assert bank.get_balances([id1, id2]) == {id1: 50.0, id2: 75.0}
+        assert bank.get_balances([]) == {}
+        
+        with pytest.raises(AccountNotFoundError) as exc_info:
+            bank.get_balances([id1, "invalid123"])
+        assert exc_info.value.account_id == "invalid123"
+    
     def test_deposit_valid_amount(self, bank):
         account_id = bank.create_account("Carol Brown", 50.0)
         bank.deposit(account_id, 25.0)
@@ -82,8 +150,9 @@ class TestBank:
         from_account = bank.create_account("Eve Davis", 100.0)
         to_account = bank.create_account("Frank Wilson", 50.0)
         
-        bank.transfer(from_account, to_account, 25.0)
+        new_balances = bank.transfer(from_account, to_account, 25.0)
         
+        assert new_balances == (75.0, 75.0)
         assert bank.get_balance(from_account) == 75.0
         assert bank.get_balance(to_account) == 75.0
     
@@ -95,6 +164,77 @@ class TestBank:
         
         assert "Cannot transfer to the same account" in str(exc_info.value)
     
+    def test_transfer_batch(self, temp_csv_file):
+        bank = Bank(temp_csv_file)
+        alice = bank.create_account("Alice", 100.0)
+        bob = bank.create_account("Bob", 0.0)
+        carol = bank.create_account("Carol", 10.0)
+        
+        # Bob can forward money received earlier in the same batch
+        bank.transfer_batch(
+            [alice, bob, carol], [bob, carol, alice], [6000, 2500, 1000]
+        )
+        
+        assert bank.get_balances([alice, bob, carol]) == {
+            alice: 50.0,
+            bob: 35.0,
+            carol: 25.0,
+        }
+        assert bank.get_bank_summary()['total_balance'] == 110.0
+        assert Bank(temp_csv_file).get_balance(bob) == 35.0
+    
+    def test_transfer_batch_is_atomic(self, bank):
+        alice = bank.create_account("Alice", 100.0)
+        bob = bank.create_account("Bob", 0.0)
+        
+        with pytest.raises(InsufficientFundsError) as exc_info:
+            bank.transfer_batch([alice, bob], [bob, alice], [5000, 7500])
+        
+        assert exc_info.value.account_id == bob
+        assert exc_info.value.requested_amount == 75.0
+        assert exc_info.value.current_balance == 50.0
+        assert bank.get_balance(alice) == 100.0
+        assert bank.get_balance(bob) == 0.0
+    
+    def test_transfer_batch_validation(self, bank):
+        alice = bank.create_account("Alice", 100.0)
+        bob = bank.create_account("Bob", 0.0)
+        
+        with pytest.raises(ValueError):
+            bank.transfer_batch([alice], [bob], [100, 200])
+        with pytest.raises(ValueError):
+            bank.transfer_batch([alice], [alice], [100])
+        with pytest.raises(InvalidAmountError):
+            bank.transfer_batch([alice], [bob], [0])
+        with pytest.raises(AccountNotFoundError):
+            bank.transfer_batch([alice], ["missing"], [100])
+        with pytest.raises(TypeError):
+            bank.transfer_batch([alice], [bob], [150.7])
+        
+        assert bank.get_balance(alice) == 100.0
+    
+    def test_transfer_kernel_without_numba(self):
+        with patch.dict(sys.modules, {'numba': None}):
+            kernel = _transfer_kernel.__wrapped__()
+        
+        balances = [100, 0]
+        assert kernel is _apply_transfers
+        assert kernel([0, 1], [1, 0], [60, 10], balances) == -1
+        assert balances == [50, 50]
+        assert kernel([1], [0], [80], balances) == 0
+    
+    def test_transfer_batch_with_numba(self, bank):
+        pytest.importorskip("numba")
+        assert _transfer_kernel() is not _apply_transfers
+        
+        alice = bank.create_account("Alice", 100.0)
+        bob = bank.create_account("Bob", 0.0)
+        bank.transfer_batch([alice, bob], [bob, alice], [6000, 2500])
+        
+        assert bank.get_balances([alice, bob]) == {alice: 65.0, bob: 35.0}
+        with pytest.raises(InsufficientFundsError):
+            bank.transfer_batch([bob], [alice], [3501])
+    
     def test_list_accounts(self, bank):
         id1 = bank.create_account("Henry Kim", 100.0)
         id2 = bank.create_account("Iris Chen", 200.0)
@@ -102,9 +242,17 @@ class TestBank:
         accounts = bank.list_accounts()
         
         assert len(accounts) == 2
-        account_names = [acc.name for acc in accounts]
-        assert "Henry Kim" in account_names
-        assert "Iris Chen" in account_names
+        assert "Henry Kim" in bank.account_names()
+        assert "Iris Chen" in bank.account_names()
+    
+    def test_account_names(self, temp_csv_file):
+        bank = Bank(temp_csv_file)
+        bank.create_account("Henry Kim", 100.0)
+        bank.create_accounts([("Henry Kim", 50.0), ("Iris Chen", 200.0)])
+        
+        assert bank.account_names() == {"Henry Kim", "Iris Chen"}
+        assert Bank(temp_csv_file).account_names() == {"Henry Kim", "Iris Chen"}
+        assert "Nobody" not in bank.account_names()
     
     def test_bank_length(self, bank):
         assert len(bank) == 0
@@ -140,16 +288,39 @@ class TestBank:
         assert summary['min_balance'] == 50.0
         assert summary['max_balance'] == 200.0
     
-    def test_bank_contains_operator(self, temp_csv_file):
+    def test_get_bank_summary_tracks_changes(self, temp_csv_file):
         bank = Bank(temp_csv_file)
+        low = bank.create_account("Low", 10.0)
+        mid = bank.create_account("Mid", 50.0)
+        high = bank.create_account("High", 100.0)
+        assert bank.get_bank_summary()['min_balance'] == 10.0
+        
+        # Moving the extremes away forces the cached min/max to be rebuilt
+        bank.deposit(low, 80.0)     # 90.0
+        bank.withdraw(high, 60.0)   # 40.0
+        summary = bank.get_bank_summary()
+        assert summary['total_balance'] == 180.0
+        assert summary['min_balance'] == 40.0
+        assert summary['max_balance'] == 90.0
+        
+        # Changes inside the current range keep the cached extremes
+        bank.transfer(mid, high, 5.0)   # 45.0 / 45.0
+        bank.create_account("Newest", 95.0)
+        summary = bank.get_bank_summary()
+        assert summary['total_balance'] == 275.0
+        assert summary['min_balance'] == 45.0
+        assert summary['max_balance'] == 95.0
+        
+        # A freshly loaded bank computes the same aggregates
+        assert Bank(temp_csv_file).get_bank_summary() == summary
+    
+    def test_bank_contains_operator(self, bank):
         account_id = bank.create_account("Test User", 100.0)
         
         assert account_id in bank
         assert "nonexistent" not in bank
     
-    def test_bank_len_operator(self, temp_csv_file):
-        bank = Bank(temp_csv_file)
-        
+    def test_bank_len_operator(self, bank):
         assert len(bank) == 0
         
         bank.create_account("User 1", 100.0)
@@ -168,13 +339,27 @@ class TestBank:
         
         # Test deposit auto-save
         bank.deposit(account_id, 50.0)
-        bank3 = Bank(temp_csv_file)
-        assert bank3.get_balance(account_id) == 150.0
+        bank2.reload()
+        assert bank2.get_balance(account_id) == 150.0
         
         # Test withdrawal auto-save
         bank.withdraw(account_id, 25.0)
-        bank4 = Bank(temp_csv_file)
-        assert bank4.get_balance(account_id) == 125.0
+        bank2.reload()
+        assert bank2.get_balance(account_id) == 125.0
+    
+    def test_reload_discards_unsaved_changes(self, temp_csv_file):
+        bank = Bank(temp_csv_file, autosave=False)
+        saved_id = bank.create_account("Saved User", 100.0)
+        bank.flush()
+        unsaved_id = bank.create_account("Unsaved User", 50.0)
+        bank.deposit(saved_id, 25.0)
+        
+        bank.reload()
+        
+        assert len(bank) == 1
+        assert unsaved_id not in bank
+        assert bank.get_balance(saved_id) == 100.0
+        assert bank.get_bank_summary()['total_balance'] == 100.0
     
     def test_transfer_atomicity(self, temp_csv_file):
         bank = Bank(temp_csv_file)
@@ -183,13 +368,122 @@ class TestBank:
         
         # Test successful transfer
         bank.transfer(account1_id, account2_id, 30.0)
-        assert bank.get_balance(account1_id) == 70.0
-        assert bank.get_balance(account2_id) == 80.0
+        assert bank.get_balances([account1_id, account2_id]) == {
+            account1_id: 70.0,
+            account2_id: 80.0,
+        }
         
         # Verify the transfer was saved
         bank2 = Bank(temp_csv_file)
-        assert bank2.get_balance(account1_id) == 70.0
-        assert bank2.get_balance(account2_id) == 80.0
+        assert bank2.get_balances([account1_id, account2_id]) == {
+            account1_id: 70.0,
+            account2_id: 80.0,
+        }
+    
+    def test_autosave_disabled_defers_writes_until_flush(self, temp_csv_file):
+        bank = Bank(temp_csv_file, autosave=False)
+        account_id = bank.create_account("Deferred User", 100.0)
+        bank.deposit(account_id, 50.0)
+        
+        # Nothing has been written yet
+        assert account_id not in Bank(temp_csv_file)
+        
+        bank.flush()
+        assert Bank(temp_csv_file).get_balance(account_id) == 150.0
+        
+        # Flushing again with nothing pending is a no-op
+        bank.flush()
+        assert Bank(temp_csv_file).get_balance(account_id) == 150.0
+    
+    def test_flush_compacts_csv(self, temp_csv_file):
+        bank = Bank(temp_csv_file)
+        account_id = bank.create_account("Compact User", 100.0)
+        
+        for _ in range(5):
+            bank.deposit(account_id, 10.0)
+        
+        # Appended rows never grow the file past twice the account count
+        with open(temp_csv_file) as f:
+            assert len(f.readlines()) - 1 <= 2 * len(bank)
+        assert Bank(temp_csv_file).get_balance(account_id) == 150.0
+    
+    def test_transaction_debug_logging(self, bank, caplog):
+        caplog.set_level(logging.DEBUG, logger="banking_system.bank.Bank")
+        
+        from_account = bank.create_account("Log User", 100.0)
+        to_account = bank.create_account("Log Target", 0.0)
+        bank.deposit(from_account, 20.0)
+        bank.withdraw(from_account, 10.0)
+        bank.transfer(from_account, to_account, 5.0)
+        bank.transfer_batch([to_account], [from_account], [100])
+        bank.create_accounts([("Batch User", 1.0)])
+        
+        messages = [record.getMessage() for record in caplog.records
+                    if record.levelno == logging.DEBUG]
+        expected = f"Created account {from_account} for Log User with balance $100.00"
+        assert expected in messages
+        assert f"Deposited $20.00 to account {from_account}" in messages
+        assert f"Withdrew $10.00 from account {from_account}" in messages
+        assert f"Transferred $5.00 from {from_account} to {to_account}" in messages
+        assert "Applied batch of 1 transfers" in messages
+        assert "Created 1 accounts" in messages
+    
+    def test_close_compacts_journal(self, temp_csv_file):
+        bank = Bank(temp_csv_file)
+        account_id = bank.create_account("Journal User", 100.0)
+        bank.create_account("Other User", 50.0)
+        bank.deposit(account_id, 10.0)
+        
+        with open(temp_csv_file) as f:
+            assert len(f.readlines()) == 4  # header, two accounts, one journal row
+        
+        bank.close()
+        
+        with open(temp_csv_file) as f:
+            assert len(f.readlines()) == 3
+        assert Bank(temp_csv_file).get_balance(account_id) == 110.0
+    
+    def test_close_does_not_recreate_removed_file(self, temp_csv_file):
+        bank = Bank(temp_csv_file)
+        account_id = bank.create_account("Journal User", 100.0)
+        bank.deposit(account_id, 10.0)
+        os.unlink(temp_csv_file)
+        
+        bank.close()
+        
+        assert not os.path.exists(temp_csv_file)
+    
+    def test_pending_changes_written_at_exit(self, temp_csv_file):
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "import sys; from banking_system.bank import Bank; "
+             "bank = Bank(sys.argv[1], autosave=False); "
+             "bank.create_account('Exit User', 5.0)",
+             temp_csv_file],
+            capture_output=True
+        )
+        
+        assert result.returncode == 0, result.stderr.decode()
+        assert "Exit User" in Bank(temp_csv_file).account_names()
+    
+    def test_unreferenced_bank_is_freed(self, temp_csv_file):
+        bank = Bank(temp_csv_file)
+        bank.create_account("Test User", 100.0)
+        bank_ref = weakref.ref(bank)
+        del bank
+        gc.collect()
+        
+        assert bank_ref() is None
+    
+    def test_exit_hook_closes_bank_once(self, temp_csv_file):
+        bank = Bank(temp_csv_file, autosave=False)
+        bank.create_account("Exit User", 5.0)
+        
+        # Run the hook as interpreter exit would; closing detaches it
+        bank._finalizer()
+        
+        assert not bank._finalizer.alive
+        assert "Exit User" in Bank(temp_csv_file).account_names()
     
     def test_save_to_csv(self, temp_csv_file):
         bank = Bank(temp_csv_file)
@@ -201,11 +495,13 @@ class TestBank:
         assert os.path.exists(temp_csv_file)
         
         # Verify CSV content
-        df = pd.read_csv(temp_csv_file)
-        assert len(df) == 2
-        assert set(df['account_id'].tolist()) == {account1_id, account2_id}
-        assert 'Wendy Chen' in df['name'].tolist()
-        assert 'Xavier Garcia' in df['name'].tolist()
+        with open(temp_csv_file, newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 2
+        assert {row['account_id'] for row in rows} == {account1_id, account2_id}
+        names = {row['name'] for row in rows}
+        assert 'Wendy Chen' in names
+        assert 'Xavier Garcia' in names
     
     def test_load_from_csv_existing_file(self, temp_csv_file):
         # Create initial bank and save data
@@ -228,6 +524,25 @@ class TestBank:
         assert account2.name == "Zoe Anderson"
         assert account2.balance == 175.0
     
+    def test_load_from_csv_large_file(self, temp_csv_file):
+        # Enough accounts to cross the pyarrow size threshold; without
+        # pyarrow installed the csv module path reads it instead
+        bank1 = Bank(temp_csv_file)
+        account_ids = bank1.create_accounts(
+            (f"Customer {i:05d}", i + 0.25) for i in range(6000)
+        )
+        bank1.deposit(account_ids[-1], 10.0)
+        assert os.path.getsize(temp_csv_file) > 256 * 1024
+        
+        bank2 = Bank(temp_csv_file)
+        
+        assert len(bank2) == 6000
+        assert bank2.get_account(account_ids[0]).name == "Customer 00000"
+        assert bank2.get_balance(account_ids[-1]) == 6009.25
+        assert [a.account_id for a in bank2.list_accounts()] == account_ids
+        total_balance = bank1.get_bank_summary()['total_balance']
+        assert bank2.get_bank_summary()['total_balance'] == total_balance
+    
     def test_load_from_csv_nonexistent_file(self, temp_csv_file):
         # Remove the file if it exists
         if os.path.exists(temp_csv_file):
@@ -248,4 +563,14 @@ class TestBank:
         assert summary['total_balance'] == 350.0
         assert summary['average_balance'] == pytest.approx(116.67, rel=1e-2)
         assert summary['min_balance'] == 50.0
-        assert summary['max_balance'] == 200.0 
\ No newline at end of file
+        assert summary['max_balance'] == 200.0
+    
+    def test_import_does_not_load_pandas(self):
+        # Importing the package must stay cheap; pandas is not a runtime import
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "import sys, banking_system; assert 'pandas' not in sys.modules"],
+            capture_output=True
+        )
+        
+        assert result.returncode == 0, result.stderr.decode()
\ No newline at end of file
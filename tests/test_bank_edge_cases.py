@@ -1,11 +1,16 @@
 import pytest
+import csv
+import logging
 import os
+import subprocess
+import sys
 import tempfile
-import pandas as pd
+from logging.handlers import QueueHandler
 from pathlib import Path
 from unittest.mock import patch
 
-from banking_system.bank import Bank
+from banking_system.account import Account
+from banking_system.bank import Bank, _configure_logging
 
 
 class TestBankEdgeCases:
@@ -30,13 +35,18 @@ class TestBankEdgeCases:
         from_account = bank.get_account(from_account_id)
         to_account = bank.get_account(to_account_id)
         
-        original_deposit = to_account.deposit
+        original_deposit = Account.deposit
         
-        def mock_deposit_failure(*args, **kwargs):
-            raise Exception("Simulated deposit failure")
+        # Account uses __slots__, so patch the class and fail only for to_account
+        def mock_deposit_failure(account, amount):
+            if account is to_account:
+                raise Exception("Simulated deposit failure")
+            original_deposit(account, amount)
         
         # Test the rollback scenario
-        with patch.object(to_account, 'deposit', side_effect=mock_deposit_failure):
+        with patch.object(
+            Account, 'deposit', autospec=True, side_effect=mock_deposit_failure
+        ):
             with pytest.raises(Exception) as exc_info:
                 bank.transfer(from_account_id, to_account_id, 30.0)
             
@@ -46,25 +56,141 @@ class TestBankEdgeCases:
             assert bank.get_balance(from_account_id) == 100.0
             assert bank.get_balance(to_account_id) == 50.0
     
+    def test_transfer_writes_once(self, temp_csv_file):
+        bank = Bank(temp_csv_file)
+        from_account_id = bank.create_account("Alice", 100.0)
+        to_account_id = bank.create_account("Bob", 50.0)
+        
+        # Both balance changes reach the file through a single flush
+        with patch.object(
+            Bank, 'flush', autospec=True, side_effect=Bank.flush
+        ) as mock_flush:
+            bank.transfer(from_account_id, to_account_id, 30.0)
+        mock_flush.assert_called_once_with(bank)
+        
+        assert Bank(temp_csv_file).get_balances([from_account_id, to_account_id]) == {
+            from_account_id: 70.0,
+            to_account_id: 80.0,
+        }
+    
     def test_save_csv_error_handling(self, temp_csv_file):
         bank = Bank(temp_csv_file)
         account_id = bank.create_account("Test User", 100.0)
         
-        # Mock pandas to_csv to raise an exception
-        with patch('pandas.DataFrame.to_csv', side_effect=Exception("CSV write error")):
+        # Mock the CSV writer to raise an exception
+        with patch(
+            'banking_system.bank.csv.writer', side_effect=Exception("CSV write error")
+        ):
             with pytest.raises(Exception) as exc_info:
                 bank.save_to_csv()
             
             assert "CSV write error" in str(exc_info.value)
     
+    def test_save_csv_is_atomic(self, temp_csv_file):
+        bank = Bank(temp_csv_file)
+        account_id = bank.create_account("Test User", 100.0)
+        
+        # A failure while swapping in the new file keeps the old contents
+        with patch('banking_system.bank.os.replace', side_effect=OSError("Disk full")):
+            with pytest.raises(OSError):
+                bank.save_to_csv()
+        
+        assert not os.path.exists(temp_csv_file + '.tmp')
+        assert Bank(temp_csv_file).get_balance(account_id) == 100.0
+    
+    def test_flush_append_error_handling(self, temp_csv_file):
+        bank = Bank(temp_csv_file)
+        account_id = bank.create_account("Test User", 100.0)
+        bank.create_account("Other User", 50.0)
+        
+        # Appending the pending row fails; the account stays dirty
+        with patch(
+            'banking_system.bank.csv.writer', side_effect=Exception("CSV append error")
+        ):
+            with pytest.raises(Exception) as exc_info:
+                bank.deposit(account_id, 10.0)
+            
+            assert "CSV append error" in str(exc_info.value)
+        
+        bank.flush()
+        assert Bank(temp_csv_file).get_balance(account_id) == 110.0
+    
+    def test_exit_errors_are_logged_before_listener_stops(self, tmp_path):
+        # A finalizer created before the import registers weakref's exit
+        # hook early; the listener must still outlive the Bank's hook
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "import sys, tempfile; keep = tempfile.TemporaryDirectory(); "
+             "from banking_system.bank import Bank; "
+             "bank = Bank(sys.argv[1], autosave=False); "
+             "bank.create_account('Exit User', 5.0)",
+             str(tmp_path / "missing" / "bank.csv")],
+            capture_output=True
+        )
+        
+        assert "Failed to save accounts to CSV" in result.stderr.decode()
+    
+    def test_flush_rewrites_missing_or_empty_file(self, temp_csv_file):
+        bank = Bank(temp_csv_file)
+        account1_id = bank.create_account("Test User", 100.0)
+        account2_id = bank.create_account("Other User", 50.0)
+        
+        # Appending to a recreated file would leave it without a header
+        os.unlink(temp_csv_file)
+        bank.deposit(account1_id, 10.0)
+        assert Bank(temp_csv_file).get_balances([account1_id, account2_id]) == {
+            account1_id: 110.0,
+            account2_id: 50.0,
+        }
+        
+        open(temp_csv_file, 'w').close()
+        bank.deposit(account2_id, 5.0)
+        assert Bank(temp_csv_file).get_balances([account1_id, account2_id]) == {
+            account1_id: 110.0,
+            account2_id: 55.0,
+        }
+    
+    def test_flush_after_torn_append(self, temp_csv_file):
+        bank = Bank(temp_csv_file)
+        account1_id = bank.create_account("Test User", 100.0)
+        account2_id = bank.create_account("Other User", 50.0)
+        
+        # A crash mid-append leaves a partial last line without a newline
+        with open(temp_csv_file, 'a', newline='') as f:
+            f.write(f"{account2_id},Other User,9")
+        
+        bank.deposit(account1_id, 10.0)
+        assert Bank(temp_csv_file).get_balances([account1_id, account2_id]) == {
+            account1_id: 110.0,
+            account2_id: 50.0,
+        }
+    
+    def test_configure_logging_installs_queue_handler(self):
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        root.handlers = []
+        try:
+            with patch('banking_system.bank.weakref.finalize') as finalize:
+                _configure_logging()
+            
+            assert len(root.handlers) == 1
+            assert isinstance(root.handlers[0], QueueHandler)
+            
+            # Stop the listener thread that was registered for exit
+            listener, stop_listener = finalize.call_args[0]
+            assert stop_listener == listener.stop
+            stop_listener()
+        finally:
+            root.handlers = saved_handlers
+            root.setLevel(saved_level)
+    
     def test_load_csv_with_missing_columns(self, temp_csv_file):
         # Create CSV with missing columns
-        df = pd.DataFrame({
-            'account_id': ['test123'],
-            'name': ['Test User']
+        with open(temp_csv_file, 'w', newline='') as f:
+            writer = csv.writer(f)
             # Missing 'balance' and 'created_at' columns
-        })
-        df.to_csv(temp_csv_file, index=False)
+            writer.writerow(('account_id', 'name'))
+            writer.writerow(('test123', 'Test User'))
         
         with pytest.raises(ValueError) as exc_info:
             Bank(temp_csv_file)
@@ -74,33 +200,151 @@ class TestBankEdgeCases:
         assert "created_at" in str(exc_info.value)
     
     def test_load_csv_with_corrupted_account_data(self, temp_csv_file):
-        # Create CSV with corrupted data - both rows will fail due to invalid types
-        df = pd.DataFrame({
-            'account_id': ['test123', 'test456'],
-            'name': ['Valid User', 'Invalid User'],
-            'balance': [100.0, 'invalid_balance'],  # Invalid balance
-            'created_at': ['2024-01-01T10:00:00', 'invalid_date']  # Invalid date
-        })
-        df.to_csv(temp_csv_file, index=False)
-        
-        # Both accounts will fail to load due to pandas type comparison issues
+        # Create CSV with corrupted data - the second row has an invalid balance
+        # and date
+        with open(temp_csv_file, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('account_id', 'name', 'balance', 'created_at'))
+            writer.writerow(('test123', 'Valid User', 100.0, '2024-01-01T10:00:00'))
+            writer.writerow(
+                ('test456', 'Invalid User', 'invalid_balance', 'invalid_date')
+            )
+        
         bank = Bank(temp_csv_file)
         
-        # Should have loaded no accounts due to data corruption
-        assert len(bank) == 0
+        # The corrupted row is skipped, the valid one is still loaded
+        assert len(bank) == 1
+        assert 'test123' in bank
+        assert 'test456' not in bank
+    
+    def test_non_ascii_names_round_trip_as_utf8(self, temp_csv_file):
+        # Run under the C locale, so the default encoding would be ASCII
+        env = dict(os.environ, PYTHONUTF8='0', PYTHONCOERCECLOCALE='0', LC_ALL='C')
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "import sys; from banking_system.bank import Bank; "
+             "bank = Bank(sys.argv[1]); "
+             "account_id = bank.create_account('Jos\\u00e9 \\u738b', 10.0); "
+             "bank.deposit(account_id, 5.0); "
+             "assert 'Jos\\u00e9 \\u738b' in Bank(sys.argv[1]).account_names()",
+             temp_csv_file],
+            capture_output=True,
+            env=env,
+        )
+        
+        assert result.returncode == 0, result.stderr.decode()
+        with open(temp_csv_file, encoding='utf-8') as f:
+            assert 'Jos\u00e9 \u738b' in f.read()
+    
+    def test_load_csv_with_utf8_bom(self, temp_csv_file):
+        # Spreadsheet programs export "CSV UTF-8" with a byte order mark
+        with open(temp_csv_file, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('account_id', 'name', 'balance', 'created_at'))
+            writer.writerow(('test123', 'Jos\u00e9', '100.00', '2024-01-01T10:00:00'))
+        
+        bank = Bank(temp_csv_file)
+        
+        assert bank.get_account('test123').name == 'Jos\u00e9'
+    
+    def test_load_csv_with_reordered_columns_and_blank_lines(self, temp_csv_file):
+        with open(temp_csv_file, 'w') as f:
+            f.write('name,created_at,account_id,balance\n')
+            f.write('Test User,2024-01-01T10:00:00,test123,100.00\n')
+            f.write('\n')
+            f.write('Other User,2024-01-02T10:00:00,test456,50.00\n')
+        
+        bank = Bank(temp_csv_file)
+        
+        assert len(bank) == 2
+        assert bank.get_account('test123').name == 'Test User'
+        assert bank.get_balance('test456') == 50.0
+    
+    def test_load_csv_orders_accounts_by_creation_time(self, temp_csv_file):
+        with open(temp_csv_file, 'w') as f:
+            f.write('account_id,name,balance,created_at\n')
+            f.write('newer,Newer User,10.00,2024-03-01T10:00:00\n')
+            f.write('older,Older User,20.00,2024-01-01T10:00:00\n')
+        
+        bank = Bank(temp_csv_file)
+        
+        account_ids = [account.account_id for account in bank.list_accounts()]
+        assert account_ids == ['older', 'newer']
+    
+    def test_load_csv_with_mixed_timezone_timestamps(self, temp_csv_file):
+        with open(temp_csv_file, 'w') as f:
+            f.write('account_id,name,balance,created_at\n')
+            f.write('naive,Naive User,10.00,2024-03-01T10:00:00\n')
+            f.write('aware,Aware User,20.00,2024-01-01T10:00:00+00:00\n')
+        
+        bank = Bank(temp_csv_file)
+        
+        # The accounts cannot be ordered by time, so file order is kept
+        account_ids = [account.account_id for account in bank.list_accounts()]
+        assert account_ids == ['naive', 'aware']
+    
+    def _write_large_csv(self, csv_path, extra_row=None):
+        bank = Bank(csv_path)
+        account_ids = bank.create_accounts(
+            (f"Customer {i:05d}", i + 0.25) for i in range(6000)
+        )
+        if extra_row is not None:
+            with open(csv_path, 'a', newline='') as f:
+                csv.writer(f).writerow(extra_row)
+        assert os.path.getsize(csv_path) > 256 * 1024
+        return account_ids
+    
+    def test_load_large_csv_with_pyarrow(self, temp_csv_file):
+        pytest.importorskip("pyarrow")
+        account_ids = self._write_large_csv(temp_csv_file)
+        
+        with patch.object(
+            Bank, '_read_rows_with_csv', autospec=True, side_effect=AssertionError
+        ):
+            bank = Bank(temp_csv_file)
+        
+        assert len(bank) == 6000
+        assert bank.get_account(account_ids[0]).name == "Customer 00000"
+        assert bank.get_balance(account_ids[-1]) == 5999.25
+    
+    def test_load_large_csv_falls_back_to_csv_module(self, temp_csv_file):
+        pytest.importorskip("pyarrow")
+        account_ids = self._write_large_csv(
+            temp_csv_file,
+            ('bad00001', 'Bad Row', 'not_a_number', '2024-01-01T10:00:00'),
+        )
+        
+        # pyarrow rejects the whole file; the csv module skips only the bad row
+        bank = Bank(temp_csv_file)
+        
+        assert len(bank) == 6000
+        assert 'bad00001' not in bank
+        assert bank.get_balance(account_ids[-1]) == 5999.25
+    
+    def test_load_large_csv_without_pyarrow(self, temp_csv_file):
+        account_ids = self._write_large_csv(temp_csv_file)
+        
+        with patch.dict(sys.modules, {'pyarrow': None}):
+            bank = Bank(temp_csv_file)
+            assert bank._read_rows_with_pyarrow() is None
+        
+        assert len(bank) == 6000
+        assert bank.get_balance(account_ids[-1]) == 5999.25
     
     def test_load_csv_general_error_handling(self, temp_csv_file):
-        # Create a file that will cause pandas.read_csv to fail
+        # Create a file with mismatched column counts
         with open(temp_csv_file, 'w') as f:
             f.write("invalid,csv,content\n")
             f.write("with,mismatched,columns,count\n")
         
-        # Mock read_csv to raise a different kind of exception
-        with patch('pandas.read_csv', side_effect=Exception("Pandas read error")):
+        # Mock the CSV reader to raise a different kind of exception
+        with patch(
+            'banking_system.bank.csv.reader', side_effect=Exception("CSV read error")
+        ):
             with pytest.raises(Exception) as exc_info:
                 Bank(temp_csv_file)
             
-            assert "Pandas read error" in str(exc_info.value)
+            assert "CSV read error" in str(exc_info.value)
     
     def test_save_csv_empty_bank(self, temp_csv_file):
         bank = Bank(temp_csv_file)
@@ -110,19 +354,18 @@ class TestBankEdgeCases:
         
         # Verify empty CSV with headers was created
         assert os.path.exists(temp_csv_file)
-        df = pd.read_csv(temp_csv_file)
-        assert df.empty
-        assert list(df.columns) == ['account_id', 'name', 'balance', 'created_at']
+        with open(temp_csv_file, newline='') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+        assert rows == []
+        assert reader.fieldnames == ['account_id', 'name', 'balance', 'created_at']
     
     def test_load_csv_account_creation_failure(self, temp_csv_file):
         # Create valid CSV data
-        df = pd.DataFrame({
-            'account_id': ['test123'],
-            'name': ['Test User'],
-            'balance': [100.0],
-            'created_at': ['2024-01-01T10:00:00']
-        })
-        df.to_csv(temp_csv_file, index=False)
+        with open(temp_csv_file, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('account_id', 'name', 'balance', 'created_at'))
+            writer.writerow(('test123', 'Test User', 100.0, '2024-01-01T10:00:00'))
         
         # Mock Account.from_dict to fail
         with patch('banking_system.bank.Account.from_dict', side_effect=Exception("Account creation failed")):
@@ -135,9 +378,10 @@ class TestBankEdgeCases:
         bank = Bank(temp_csv_file)
         account_id = bank.create_account("Test User", 100.0)
         
-        # Mock account.to_dict to fail
-        account = bank.get_account(account_id)
-        with patch.object(account, 'to_dict', side_effect=Exception("Serialization failed")):
+        # Mock Account.to_row to fail
+        with patch.object(
+            Account, 'to_row', side_effect=Exception("Serialization failed")
+        ):
             with pytest.raises(Exception):
                 bank.save_to_csv()
 
@@ -155,9 +399,9 @@ class TestBankEdgeCases:
         assert len(bank) == 0
 
     def test_load_csv_empty_data_error(self, temp_csv_file):
-        # Create a CSV file with just whitespace (triggers EmptyDataError)
+        # Create a CSV file with just whitespace (no usable header row)
         with open(temp_csv_file, 'w') as f:
-            f.write('   \n  \n  ')  # Only whitespace, triggers EmptyDataError
+            f.write('   \n  \n  ')  # Only whitespace, no header
         
         # Create bank with existing file, then manually call load_from_csv to trigger the error
         bank = Bank("dummy.csv")  # Use dummy to avoid auto-loading
@@ -219,9 +463,9 @@ class TestBankCLIIntegration:
         # Operations on bank1 save to CSV
         bank1.deposit(account_id, 50.0)
         
-        # New bank3 should see the updated balance
-        bank3 = Bank(temp_csv_file)
-        assert bank3.get_balance(account_id) == 150.0
+        # bank2 should see the updated balance after reloading
+        bank2.reload()
+        assert bank2.get_balance(account_id) == 150.0
     
     def test_bank_file_path_edge_cases(self):
         # Test with relative path
@@ -254,12 +498,11 @@ class TestBankPerformanceEdgeCases:
     
     def test_large_number_of_accounts(self, temp_csv_file):
         bank = Bank(temp_csv_file)
-        account_ids = []
         
         # Create 100 accounts
-        for i in range(100):
-            account_id = bank.create_account(f"User{i}", float(i * 10))
-            account_ids.append(account_id)
+        account_ids = bank.create_accounts(
+            (f"User{i}", float(i * 10)) for i in range(100)
+        )
         
         assert len(bank) == 100
         
@@ -275,9 +518,11 @@ class TestBankPerformanceEdgeCases:
         assert len(bank2) == 100
         
         # Verify a few random accounts
-        assert bank2.get_balance(account_ids[0]) == 0.0
-        assert bank2.get_balance(account_ids[50]) == 500.0
-        assert bank2.get_balance(account_ids[99]) == 990.0
+        assert bank2.get_balances(account_ids[::50] + account_ids[-1:]) == {
+            account_ids[0]: 0.0,
+            account_ids[50]: 500.0,
+            account_ids[99]: 990.0,
+        }
     
     def test_very_large_amounts(self, temp_csv_file):
         bank = Bank(temp_csv_file)
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from banking_system.exceptions import (
@@ -86,6 +89,14 @@ class TestBankingExceptions:
         assert isinstance(exception, BankingException)
         assert isinstance(exception, Exception)
     
+    def test_account_id_survives_copy_and_pickle(self):
+        exceptions = (AccountNotFoundError("abc123"), DuplicateAccountError("abc123"))
+        for exception in exceptions:
+            copies = (copy.copy(exception), pickle.loads(pickle.dumps(exception)))
+            for restored in copies:
+                assert type(restored) is type(exception)
+                assert restored.account_id == "abc123"
+    
     def test_exception_chaining(self):
         # Test that specific exceptions can be caught as BankingException
         with pytest.raises(BankingException):